@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from copy import deepcopy
-
 from .model import LRCTime, BaseLyricDocument, CombinedLyricLine, LyricMeta, LyricLine
-from functools import total_ordering
+from bisect import bisect_left, bisect_right
+from itertools import filterfalse
+from math import inf
 import re
-from typing import Optional, List, Iterator, Tuple, Union
+from typing import Optional, List, Iterable, Iterator, Tuple, Union
+
+_TIMED_CHAR_RE = re.compile(r"\[(\d{2}):(\d{2})\.(\d{1,3})\]([^\[\]]*)")
 
 
-@total_ordering
 class TimedCharacter:
     """带时间戳的单个字符 - 基本单位类"""
 
+    __slots__ = ("time", "character")
+
     def __init__(self, time: LRCTime, character: str):
         self.time = time
         self.character = character
@@ -38,10 +41,26 @@ class TimedCharacter:
     def __repr__(self) -> str:
         return f"TimedCharacter(time={self.time}, character='{self.character}')"
 
+    # 大小比较只看时间，相等比较同时要求字符相同
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, TimedCharacter):
             return NotImplemented
-        return self.time < other.time
+        return self.time._total_ms < other.time._total_ms
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, TimedCharacter):
+            return NotImplemented
+        return self.time._total_ms <= other.time._total_ms
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, TimedCharacter):
+            return NotImplemented
+        return self.time._total_ms > other.time._total_ms
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, TimedCharacter):
+            return NotImplemented
+        return self.time._total_ms >= other.time._total_ms
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TimedCharacter):
@@ -49,73 +68,176 @@ class TimedCharacter:
         return self.time == other.time and self.character == other.character
 
 
-@total_ordering
+class _TimedCharacterView(TimedCharacter):
+    """EnhancedLyricLine 缓存的只读字符
+
+    行内数据按列存储，这些对象只是快照；修改属性会直接报错，
+    修改字符请使用 add_character、extend_characters 或给 characters 赋值。
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            "characters of an EnhancedLyricLine are read-only; "
+            "use add_character/extend_characters or assign to characters"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("characters of an EnhancedLyricLine are read-only")
+
+    @classmethod
+    def _many_from_columns(
+        cls, ms: List[int], chars: List[str]
+    ) -> List[TimedCharacter]:
+        """由时间列与字符列批量构建，数据已校验，跳过 __init__ 与逐个构造的开销"""
+        new = cls.__new__
+        set_time = TimedCharacter.time.__set__
+        set_character = TimedCharacter.character.__set__
+        characters = []
+        for time, character in zip(LRCTime._many_from_ms(ms), chars):
+            char = new(cls)
+            set_time(char, time)
+            set_character(char, character)
+            characters.append(char)
+        return characters
+
+
 class EnhancedLyricLine:
-    """歌词行，包含多个带时间戳的字符"""
+    """歌词行，包含多个带时间戳的字符
+
+    字符按列存储：_ms 为各字符的时间（毫秒），_chars 为对应的字符。
+    TimedCharacter 在首次访问 characters、下标或迭代时构建并缓存（只读），字符变化后重建。
+    """
+
+    __slots__ = (
+        "_ms",
+        "_chars",
+        "_end_time_override",
+        "_last_index",
+        "_text",
+        "_start_time",
+        "_end_time_cached",
+        "_characters",
+    )
 
     def __init__(self, characters: Optional[List[TimedCharacter]] = None):
-        self.characters = characters or []
+        self._ms: List[int] = []
+        self._chars: List[str] = []
         self._end_time_override: Optional[LRCTime] = None  # 用于存储覆写的结束时间
+        self.characters = characters or []
+
+    def _invalidate_cache(self) -> None:
+        """字符或结束时间变化后清除缓存，缓存在下次访问时重新计算"""
+        self._last_index: int = -1  # 上次查询命中的字符下标
+        self._text: Optional[str] = None
+        self._start_time: Optional[LRCTime] = None
+        self._end_time_cached: Optional[LRCTime] = None
+        self._characters: Optional[Tuple[TimedCharacter, ...]] = None
+
+    @property
+    def characters(self) -> Tuple[TimedCharacter, ...]:
+        """行内全部字符
+
+        返回只读元组，其中的 TimedCharacter 为只读快照，修改其属性会抛出
+        AttributeError；请通过 add_character、extend_characters 或给 characters
+        赋值来修改本行。
+        """
+        if self._characters is None:
+            self._characters = tuple(
+                _TimedCharacterView._many_from_columns(self._ms, self._chars)
+            )
+        return self._characters
+
+    @characters.setter
+    def characters(self, characters: Iterable[TimedCharacter]) -> None:
+        self._ms = []
+        self._chars = []
+        self.extend_characters(characters)
 
     def add_character(self, character: TimedCharacter) -> None:
         """添加字符到行中"""
-        self.characters.append(character)
-
-    def extend_characters(self, characters: List[TimedCharacter]) -> None:
-        """批量添加字符"""
-        self.characters.extend(characters)
+        total_ms, char = character.time.total_milliseconds, character.character
+        self._ms.append(total_ms)
+        self._chars.append(char)
+        self._invalidate_cache()
+
+    def extend_characters(self, characters: Iterable[TimedCharacter]) -> None:
+        """批量添加字符（单次遍历，支持生成器等一次性可迭代对象）"""
+        ms_append = self._ms.append
+        chars_append = self._chars.append
+        for char in characters:
+            # 先读出两个字段再写入，保证两列长度始终一致
+            total_ms, character = char.time.total_milliseconds, char.character
+            ms_append(total_ms)
+            chars_append(character)
+        self._invalidate_cache()
 
     @property
     def start_time(self) -> Optional[LRCTime]:
         """行开始时间（第一个字符的时间）"""
-        if not self.characters:
-            return None
-        return self.characters[0].time
+        if self._start_time is None and self._ms:
+            self._start_time = LRCTime.from_total_milliseconds(self._ms[0])
+        return self._start_time
 
     @property
     def end_time(self) -> Optional[LRCTime]:
         """行结束时间（优先使用覆写时间，否则使用最后一个字符的时间）"""
-        if self._end_time_override:
-            return self._end_time_override
-        if not self.characters:
-            return None
-        return self.characters[-1].time
+        if self._end_time_cached is None:
+            if self._end_time_override:
+                self._end_time_cached = self._end_time_override
+            elif self._ms:
+                self._end_time_cached = LRCTime.from_total_milliseconds(self._ms[-1])
+        return self._end_time_cached
 
     def set_end_time_override(self, end_time: LRCTime) -> None:
         """设置覆写的结束时间"""
         self._end_time_override = end_time
+        self._end_time_cached = None
 
     def clear_end_time_override(self) -> None:
         """清除覆写的结束时间"""
         self._end_time_override = None
+        self._end_time_cached = None
 
     @property
     def text(self) -> str:
         """获取完整行文本"""
-        return "".join(char.character for char in self.characters)
+        if self._text is None:
+            self._text = "".join(self._chars)
+        return self._text
 
     @property
     def text_without_whitespace(self) -> str:
         """获取去除空白字符的文本"""
-        return "".join(
-            char.character for char in self.characters if not char.is_whitespace()
-        )
+        return "".join(filterfalse(str.isspace, self._chars))
 
     def get_character_at_time(self, time: LRCTime) -> Optional[TimedCharacter]:
-        """获取指定时间应该显示的字符"""
-        current_char = None
-        for char in self.characters:
-            if char.time <= time:
-                current_char = char
-            else:
-                break
-        return current_char
+        """获取指定时间应该显示的字符（字符需按时间排序）"""
+        times = self._ms
+        ms = time.total_milliseconds
+
+        # 播放时查询时间通常单调递增，先检查上次命中的位置及其下一个位置
+        index = self._last_index
+        if 0 <= index < len(times) and times[index] <= ms:
+            following = index + 1
+            if following == len(times) or ms < times[following]:
+                return self[index]
+            if following + 1 == len(times) or ms < times[following + 1]:
+                self._last_index = following
+                return self[following]
+
+        index = bisect_right(times, ms) - 1
+        self._last_index = index
+        return self[index] if index >= 0 else None
 
     def get_characters_in_range(
         self, start_time: LRCTime, end_time: LRCTime
     ) -> List[TimedCharacter]:
-        """获取时间范围内的所有字符"""
-        return [char for char in self.characters if start_time <= char.time <= end_time]
+        """获取时间范围内的所有字符（字符需按时间排序）"""
+        lo = bisect_left(self._ms, start_time.total_milliseconds)
+        hi = bisect_right(self._ms, end_time.total_milliseconds, lo)
+        return list(self.characters[lo:hi])
 
     def split_by_whitespace(self) -> List[List[TimedCharacter]]:
         """按空白字符分割成词语组"""
@@ -136,91 +258,136 @@ class EnhancedLyricLine:
         return words
 
     def sort_characters(self) -> None:
-        """按时间排序字符"""
-        self.characters.sort()
+        """按时间排序字符（稳定排序，同一时间的字符保持原有顺序）"""
+        order = sorted(range(len(self._ms)), key=self._ms.__getitem__)
+        self._ms = [self._ms[i] for i in order]
+        self._chars = [self._chars[i] for i in order]
+        self._invalidate_cache()
 
     def is_empty(self) -> bool:
-        """判断是否为空行"""
-        return len(self.characters) == 0 or all(
-            char.is_empty() for char in self.characters
-        )
+        """判断是否为空行（无字符或所有字符均为空）"""
+        return not self.text
 
     def __str__(self) -> str:
-        return "".join(str(char) for char in self.characters)
+        format_ms = LRCTime._format
+        return "".join(
+            [f"[{format_ms(ms)}]{char}" for ms, char in zip(self._ms, self._chars)]
+        )
 
     def __repr__(self) -> str:
-        return f"EnhancedLyricLine(characters={len(self.characters)}, text='{self.text[:20]}...')"
+        return f"EnhancedLyricLine(characters={len(self._ms)}, text='{self.text[:20]}...')"
 
     def __len__(self) -> int:
-        return len(self.characters)
+        return len(self._ms)
 
     def __iter__(self) -> Iterator[TimedCharacter]:
         return iter(self.characters)
 
     def __getitem__(self, index: int | slice) -> TimedCharacter | List[TimedCharacter]:
+        if isinstance(index, slice):
+            return list(self.characters[index])
         return self.characters[index]
 
+    def _start_ms(self) -> float:
+        """比较用的开始时间（毫秒），空行视为无穷大，排在最后"""
+        return self._ms[0] if self._ms else inf
+
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, EnhancedLyricLine):
             return NotImplemented
-        self_time = self.start_time
-        other_time = other.start_time
-        if self_time is None:
-            return False
-        if other_time is None:
-            return True
-        return self_time < other_time
+        return self._start_ms() < other._start_ms()
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, EnhancedLyricLine):
+            return NotImplemented
+        return self._start_ms() <= other._start_ms()
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, EnhancedLyricLine):
+            return NotImplemented
+        return self._start_ms() > other._start_ms()
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, EnhancedLyricLine):
+            return NotImplemented
+        return self._start_ms() >= other._start_ms()
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, EnhancedLyricLine):
             return NotImplemented
-        return self.start_time == other.start_time
+        return self._start_ms() == other._start_ms()
 
     @classmethod
     def from_string(cls, line_str: str) -> "EnhancedLyricLine":
         """从字符串解析歌词行"""
-        pattern = r"\[(\d{2}):(\d{2})\.(\d{1,3})\]([^\[\]]*)"
-        matches: List[Tuple[str, str, str, str]] = re.findall(pattern, line_str)
+        return cls.from_matches(_TIMED_CHAR_RE.findall(line_str))
 
-        characters = []
+    @classmethod
+    def from_matches(
+        cls, matches: List[Tuple[str, str, str, str]]
+    ) -> "EnhancedLyricLine":
+        """从 _TIMED_CHAR_RE.findall 的结果构建歌词行"""
+        ms: List[int] = []
+        chars: List[str] = []
         for minutes, seconds, milliseconds, char in matches:
-            characters.append(
-                TimedCharacter.standard_parse(minutes, seconds, milliseconds, char)
+            # 正则只保证两位数字，秒数仍可能为 60–99
+            sec_val = int(seconds)
+            if sec_val > 59:
+                raise ValueError("Seconds must be between 0 and 59")
+            ms.append(
+                int(minutes) * 60000 + sec_val * 1000 + int(milliseconds.ljust(3, "0"))
             )
+            chars.append(char)
 
-        return cls(characters)
+        line = cls()
+        line._ms = ms
+        line._chars = chars
+        return line
 
     @classmethod
     def empty_line(cls) -> "EnhancedLyricLine":
         """创建空行"""
         return cls([])
 
-@total_ordering
 class EnhancedCombinedLyricLine:
     def __init__(self, origin: EnhancedLyricLine, *trans: LyricLine) -> None:
         self.origin: EnhancedLyricLine = origin
         self.start_time: LRCTime = origin.start_time
         self.end_time: LRCTime = origin.end_time
-        self.trans: List[LyricLine] = []
+        # 翻译与原文共用开始时间，只保存翻译文本
+        self.trans: List[str] = [t.texts for t in trans]
 
-        for t in trans:
-            copy_line = deepcopy(t)
-            copy_line.time = self.start_time
-            self.trans.append(copy_line)
+    def _lrc_lines(self) -> List[str]:
+        """按行返回 LRC 文本：原文行及非空的翻译行"""
+        if self.origin.text == "":
+            return [f"[{self.start_time}]{self.origin.text}"]
+        lyrics: List[str] = [str(self.origin)]
+        lyrics.extend([f"[{self.start_time}]{t}" for t in self.trans if t != ""])
+        return lyrics
 
     def __str__(self) -> str:
-        if self.origin.text == "":
-            return f"[{self.start_time}]{self.origin.text}"
-        else:
-            lyrics: List[str] = [str(self.origin)]
-            lyrics.extend(str(t) for t in self.trans if t.texts != "")
-            return "\n".join(lyrics)
+        return "\n".join(self._lrc_lines())
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, CombinedLyricLine):
             return NotImplemented
         return self.start_time < other.time
 
+    def __le__(self, other) -> bool:
+        if not isinstance(other, CombinedLyricLine):
+            return NotImplemented
+        return self.start_time <= other.time
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, CombinedLyricLine):
+            return NotImplemented
+        return self.start_time > other.time
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, CombinedLyricLine):
+            return NotImplemented
+        return self.start_time >= other.time
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, CombinedLyricLine):
             return NotImplemented
@@ -233,10 +400,13 @@ class EnhancedLyricDocument(BaseLyricDocument):
         self.meta: List[LyricMeta] = meta
 
     def to_lrc(self) -> str:
-        lyrics: List[str] = []
+        lyrics: List[str] = list(map(str, self.meta))
 
-        lyrics.extend(str(m) for m in self.meta)
-        lyrics.extend(str(t) for t in self.lines)
+        for line in self.lines:
+            if isinstance(line, (CombinedLyricLine, EnhancedCombinedLyricLine)):
+                lyrics.extend(line._lrc_lines())
+            else:
+                lyrics.append(str(line))
 
         return "\n".join(lyrics)
 
@@ -1,12 +1,12 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from datetime import timedelta
-from functools import total_ordering
-from typing import List, Union
+from typing import Iterable, List, Optional, Union
 
 
-@total_ordering
 class LRCTime:
+    # Besides __init__, only _from_ms and _many_from_ms fill these slots
+    __slots__ = ("_total_ms", "_rendered")
+
     def __init__(self, minutes: str, seconds: str, milliseconds: str) -> None:
         """
         Initialize an LRCTime object from string-based start_time parts.
@@ -47,15 +47,68 @@ class LRCTime:
         if not (0 <= ms_val <= 999):
             raise ValueError("Milliseconds must be between 0 and 999")
 
-        # Create the start_time object
-        self.time = timedelta(minutes=min_val, seconds=sec_val, milliseconds=ms_val)
+        # Store the start_time as integer milliseconds
+        self._total_ms: int = min_val * 60000 + sec_val * 1000 + ms_val
+        self._rendered: Optional[str] = None  # cached __str__, built on first use
+
+    @classmethod
+    def _from_trusted_ints(cls, min_val: int, sec_val: int, ms_val: int) -> "LRCTime":
+        """
+        Build an LRCTime from already-parsed integer parts with minimal checks.
+
+        Only for parser input matched by the two-digit MM:SS.mmm timestamp regex,
+        which already rules out negative values and milliseconds above 999.
+        Seconds are still checked because two digits allow 60–99.
+
+        Raises:
+            ValueError: If the seconds are greater than 59
+        """
+        if sec_val > 59:
+            raise ValueError("Seconds must be between 0 and 59")
+        return cls._from_ms(min_val * 60000 + sec_val * 1000 + ms_val)
+
+    @classmethod
+    def _from_ms(cls, total_ms: int) -> "LRCTime":
+        """Build an LRCTime from a known-valid millisecond total without checks."""
+        self = cls.__new__(cls)
+        self._total_ms = total_ms
+        self._rendered = None
+        return self
+
+    @classmethod
+    def _many_from_ms(cls, ms_list: Iterable[int]) -> List["LRCTime"]:
+        """
+        Bulk version of _from_ms for known-valid millisecond totals.
+
+        The slots are filled inline rather than by calling _from_ms per item;
+        keep the two in sync when adding slots.
+        """
+        new = cls.__new__
+        times: List[LRCTime] = []
+        for total_ms in ms_list:
+            self = new(cls)
+            self._total_ms = total_ms
+            self._rendered = None
+            times.append(self)
+        return times
 
     @classmethod
     def from_total_milliseconds(cls, milliseconds: int):
-        minutes = milliseconds // 60000
-        seconds = (milliseconds % 60000) // 1000
-        milliseconds_val = milliseconds % 1000
-        return cls(f"{minutes:02d}", f"{seconds:02d}", f"{milliseconds_val:03d}")
+        if not isinstance(milliseconds, int):
+            raise TypeError("Total milliseconds must be an integer")
+        if milliseconds < 0:
+            raise ValueError("Total milliseconds cannot be negative")
+        return cls._from_ms(milliseconds)
+
+    @staticmethod
+    def _format(total_ms: int) -> str:
+        """Format integer milliseconds as an LRC timestamp, e.g. "00:12.340"."""
+        # %-formatting is measurably faster than an f-string here (hot export path)
+        return "%02d:%02d.%03d" % (  # noqa: UP031
+            total_ms // 60000,
+            total_ms // 1000 % 60,
+            total_ms % 1000,
+        )
 
     @property
     def milliseconds(self) -> int:
@@ -68,7 +121,7 @@ class LRCTime:
         Returns:
             int: Millisecond portion of the start_time.
         """
-        return self.total_milliseconds % 1000
+        return self._total_ms % 1000
 
     @property
     def seconds(self) -> int:
@@ -81,7 +134,7 @@ class LRCTime:
         Returns:
             int: Second portion of the start_time.
         """
-        return (self.total_milliseconds // 1000) % 60
+        return (self._total_ms // 1000) % 60
 
     @property
     def minutes(self) -> int:
@@ -94,7 +147,17 @@ class LRCTime:
         Returns:
             int: Minute portion of the start_time.
         """
-        return self.total_milliseconds // 60000
+        return self._total_ms // 60000
+
+    @property
+    def time(self) -> timedelta:
+        """
+        Get the start_time as a timedelta object.
+
+        Returns:
+            timedelta: Time elapsed since 0:00.000
+        """
+        return timedelta(milliseconds=self._total_ms)
 
     @property
     def total_milliseconds(self) -> int:
@@ -107,7 +170,7 @@ class LRCTime:
         Returns:
             int: Total milliseconds since 0:00.000
         """
-        return round(self.time.total_seconds() * 1000)
+        return self._total_ms
 
     def __str__(self) -> str:
         """
@@ -116,83 +179,179 @@ class LRCTime:
         Returns:
             str: Formatted as [MM:SS.mmm], e.g. "00:12.340"
         """
-        return f"{self.minutes:02}:{self.seconds:02}.{self.milliseconds:03}"
+        if self._rendered is None:
+            self._rendered = LRCTime._format(self._total_ms)
+        return self._rendered
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, LRCTime):
             return NotImplemented
-        return self.time == other.time
+        return self._total_ms == other._total_ms
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, LRCTime):
+            return NotImplemented
+        return self._total_ms != other._total_ms
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, LRCTime):
             return NotImplemented
-        return self.time < other.time
+        return self._total_ms < other._total_ms
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, LRCTime):
+            return NotImplemented
+        return self._total_ms <= other._total_ms
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, LRCTime):
+            return NotImplemented
+        return self._total_ms > other._total_ms
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, LRCTime):
+            return NotImplemented
+        return self._total_ms >= other._total_ms
+
+    def __hash__(self) -> int:
+        return hash(self._total_ms)
 
 
-@total_ordering
 class LyricLine:
+    __slots__ = ("_time", "_texts", "_rendered")
+
     def __init__(self, time: LRCTime, texts: str) -> None:
-        self.time = time
-        self.texts = texts
+        self._time = time
+        self._texts = texts
+        self._rendered: Optional[str] = None  # cached __str__, reset on assignment
+
+    @property
+    def time(self) -> LRCTime:
+        return self._time
+
+    @time.setter
+    def time(self, time: LRCTime) -> None:
+        self._time = time
+        self._rendered = None
+
+    @property
+    def texts(self) -> str:
+        return self._texts
+
+    @texts.setter
+    def texts(self, texts: str) -> None:
+        self._texts = texts
+        self._rendered = None
 
     def __str__(self) -> str:
-        return f"[{self.time}]{self.texts}"
+        if self._rendered is None:
+            self._rendered = f"[{self._time}]{self._texts}"
+        return self._rendered
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, LyricLine):
+            return NotImplemented
+        return self._time._total_ms < other._time._total_ms
 
-    def __lt__(self, other: object):
+    def __le__(self, other: object) -> bool:
         if not isinstance(other, LyricLine):
             return NotImplemented
-        return self.time < other.time
+        return self._time._total_ms <= other._time._total_ms
 
-    def __eq__(self, other: object):
+    def __gt__(self, other: object) -> bool:
         if not isinstance(other, LyricLine):
             return NotImplemented
-        return self.time == other.time
+        return self._time._total_ms > other._time._total_ms
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, LyricLine):
+            return NotImplemented
+        return self._time._total_ms >= other._time._total_ms
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LyricLine):
+            return NotImplemented
+        return self._time._total_ms == other._time._total_ms
 
     @classmethod
     def empty_line(cls) -> "LyricLine":
         return cls(LRCTime("00", "00", "000"), "")
 
 
-@total_ordering
 class CombinedLyricLine:
     def __init__(self, origin: LyricLine, *trans: LyricLine) -> None:
         self.origin: LyricLine = origin
         self.time: LRCTime = origin.time
-        self.trans: List[LyricLine] = []
+        # Translations share the origin's time, so only their texts are kept
+        self.trans: List[str] = [t.texts for t in trans]
 
-        for t in trans:
-            copy_line = deepcopy(t)
-            copy_line.time = self.time
-            self.trans.append(copy_line)
+    def _lrc_lines(self) -> List[str]:
+        """Return the LRC output lines: the origin, then non-empty translations."""
+        if self.origin.texts == "":
+            return [f"[{self.time}]{self.origin.texts}"]
+        lyrics: List[str] = [str(self.origin)]
+        lyrics.extend([f"[{self.time}]{t}" for t in self.trans if t != ""])
+        return lyrics
 
     def __str__(self) -> str:
-        if self.origin.texts == "":
-            return f"[{self.time}]{self.origin.texts}"
-        else:
-            lyrics: List[str] = [str(self.origin)]
-            lyrics.extend(str(t) for t in self.trans if t.texts != "")
-            return "\n".join(lyrics)
+        return "\n".join(self._lrc_lines())
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, CombinedLyricLine):
             return NotImplemented
-        return self.time < other.time
+        return self.time._total_ms < other.time._total_ms
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, CombinedLyricLine):
+            return NotImplemented
+        return self.time._total_ms <= other.time._total_ms
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, CombinedLyricLine):
+            return NotImplemented
+        return self.time._total_ms > other.time._total_ms
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, CombinedLyricLine):
+            return NotImplemented
+        return self.time._total_ms >= other.time._total_ms
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, CombinedLyricLine):
             return NotImplemented
-        return self.time == other.time
+        return self.time._total_ms == other.time._total_ms
 
 
 class LyricMeta:
+    __slots__ = ("_tag", "_value", "_rendered")
+
     def __init__(self, tag: str, value: str) -> None:
         if not tag or not value:
             raise ValueError("Tag and value cannot be empty.")
-        self.tag: str = tag
-        self.value: str = value
+        self._tag: str = tag
+        self._value: str = value
+        self._rendered: str = f"[{tag}:{value}]"
+
+    @property
+    def tag(self) -> str:
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: str) -> None:
+        self._tag = tag
+        self._rendered = f"[{tag}:{self._value}]"
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._value = value
+        self._rendered = f"[{self._tag}:{value}]"
 
     def __str__(self) -> str:
-        return f"[{self.tag}:{self.value}]"
+        return self._rendered
 
 
 class BaseLyricDocument(ABC):
@@ -209,10 +368,13 @@ class StandardLyricDocument(BaseLyricDocument):
         self.meta = meta
 
     def to_lrc(self) -> str:
-        lyrics: List[str] = []
+        lyrics: List[str] = list(map(str, self.meta))
 
-        lyrics.extend(str(m) for m in self.meta)
-        lyrics.extend(str(t) for t in self.lines)
+        for line in self.lines:
+            if isinstance(line, CombinedLyricLine):
+                lyrics.extend(line._lrc_lines())
+            else:
+                lyrics.append(str(line))
 
         return "\n".join(lyrics)
 
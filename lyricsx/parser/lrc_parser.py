@@ -1,8 +1,13 @@
 import re
+from bisect import bisect_left
 from datetime import timedelta
 from typing import List, Tuple, Union
 
-from lyricsx.enhanced_model import EnhancedLyricDocument, EnhancedLyricLine
+from lyricsx.enhanced_model import (
+    _TIMED_CHAR_RE,
+    EnhancedLyricDocument,
+    EnhancedLyricLine,
+)
 from lyricsx.model import (
     CombinedLyricLine,
     LRCTime,
@@ -11,6 +16,12 @@ from lyricsx.model import (
     StandardLyricDocument,
 )
 
+_TAG_RE = re.compile(r"\[([a-zA-Z]{2,3}):([^]]+)]")
+# 每行匹配一次：行首的标签 [ar:xxx]，或行内第一个时间戳及其后的歌词
+_LRC_LINE_RE = re.compile(
+    _TAG_RE.pattern + r"|.*?\[(\d{2}):(\d{2})\.(\d{1,3})](.*)"
+)
+
 
 class StandardLRCParser:
     @staticmethod
@@ -19,23 +30,20 @@ class StandardLRCParser:
         meta: List[LyricMeta] = []
 
         for line in text.splitlines():
-            line = line.strip()
+            match = _LRC_LINE_RE.match(line.strip())
+            if not match:
+                continue
 
-            tag_match = re.match(r"\[([a-zA-Z]{2,3}):([^]]+)]", line)
-            if tag_match:
-                meta.append(LyricMeta(tag=tag_match.group(1), value=tag_match.group(2)))
+            tag, value, minute, sec, msec, texts = match.groups()
+            if tag is not None:
+                meta.append(LyricMeta(tag=tag, value=value))
                 continue
 
             # 歌词行，如 [00:12.34]Hello
-            time_text_match = re.findall(r"\[(\d{2}):(\d{2})\.(\d{1,3})](.*)", line)
-            try:
-                if len(time_text_match[0]) == 4:
-                    minute, sec, msec, text = time_text_match[0]
-                    msec = msec.ljust(3, "0")
-                    lrc_time = LRCTime(minute, sec, msec)
-                    lines.append(LyricLine(lrc_time, text))
-            except IndexError:
-                pass
+            lrc_time = LRCTime._from_trusted_ints(
+                int(minute), int(sec), int(msec.ljust(3, "0"))
+            )
+            lines.append(LyricLine(lrc_time, texts))
 
         return StandardLyricDocument(lines, meta)
 
@@ -53,22 +61,29 @@ class StandardLRCParser:
         for t in parsed_trans:
             t.lines.sort()
 
+        trans_columns: List[Tuple[List[LyricLine], List[int]]] = [
+            (t.lines, [x.time.total_milliseconds for x in t.lines])
+            for t in parsed_trans
+        ]
+        # 原文行已排序，每份翻译的查找起点只会前进
+        cursors: List[int] = [0] * len(parsed_trans)
+        empty_line = LyricLine.empty_line()
+
         for o in parsed_origin.lines:
             available_trans: List[LyricLine] = []
+            o_ms = o.time.total_milliseconds
+            lower = o_ms - interval
+            upper = o_ms + interval
 
-            for t in parsed_trans:
-                # available_tran = list(filter(lambda x: abs(x.start_time.total_milliseconds - o.start_time.total_milliseconds) < interval, t.lines))
-                available_tran = [
-                    x
-                    for x in t.lines
-                    if abs(x.time.total_milliseconds - o.time.total_milliseconds)
-                    <= interval
-                ]
-                if len(available_tran) > 0:
-                    available_trans.append(available_tran[0])
+            for index, (t_lines, t_times) in enumerate(trans_columns):
+                # 取时间差不超过 interval 的第一行翻译
+                i = bisect_left(t_times, lower, cursors[index])
+                cursors[index] = i
+                if i < len(t_times) and t_times[i] <= upper:
+                    available_trans.append(t_lines[i])
 
             if not available_trans:
-                final_lines.append(CombinedLyricLine(o, LyricLine.empty_line()))
+                final_lines.append(CombinedLyricLine(o, empty_line))
             else:
                 final_lines.append(CombinedLyricLine(o, *available_trans))
 
@@ -87,16 +102,15 @@ class EnhancedLyricParser:
         for line in text.splitlines():
             line = line.strip()
 
-            tag_match = re.match(r"\[([a-zA-Z]{2,3}):([^]]+)]", line)
+            tag_match = _TAG_RE.match(line)
             if tag_match:
                 meta.append(LyricMeta(tag=tag_match.group(1), value=tag_match.group(2)))
                 continue
 
             # 歌词行，如 [00:12.34]Hello
-            pattern = r"\[(\d{2}):(\d{2})\.(\d{1,3})\]([^\[\]]*)"
-            time_text_match = re.findall(pattern, line)
-            if time_text_match:
-                lines.append(EnhancedLyricLine.from_string(line))
+            matches = _TIMED_CHAR_RE.findall(line)
+            if matches:
+                lines.append(EnhancedLyricLine.from_matches(matches))
 
         return EnhancedLyricDocument(lines, meta)
 
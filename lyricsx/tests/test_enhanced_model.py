@@ -0,0 +1,162 @@
+import unittest
+
+from lyricsx.enhanced_model import EnhancedLyricLine, TimedCharacter
+from lyricsx.model import LRCTime
+
+
+def at(ms: int) -> LRCTime:
+    return LRCTime.from_total_milliseconds(ms)
+
+
+def char(ms: int, character: str) -> TimedCharacter:
+    return TimedCharacter(at(ms), character)
+
+
+class EnhancedLyricLineTest(unittest.TestCase):
+    def test_from_string(self):
+        line = EnhancedLyricLine.from_string("[00:01.00]a[00:01.5]b[00:02.000]")
+        self.assertEqual(line.text, "ab")
+        self.assertEqual(len(line), 3)
+        self.assertEqual(line.start_time, at(1000))
+        self.assertEqual(line.end_time, at(2000))
+        self.assertEqual(str(line), "[00:01.000]a[00:01.500]b[00:02.000]")
+
+    def test_add_character(self):
+        line = EnhancedLyricLine([char(1000, "a")])
+        self.assertEqual(line.text, "a")
+        line.add_character(char(2000, "b"))
+        self.assertEqual(line.text, "ab")
+        self.assertEqual(len(line), 2)
+        self.assertEqual(line.end_time, at(2000))
+        self.assertEqual(line[-1], char(2000, "b"))
+
+    def test_extend_characters(self):
+        line = EnhancedLyricLine.empty_line()
+        self.assertTrue(line.is_empty())
+        self.assertIsNone(line.start_time)
+        line.extend_characters([char(1000, "a"), char(2000, " "), char(3000, "b")])
+        self.assertFalse(line.is_empty())
+        self.assertEqual(line.text, "a b")
+        self.assertEqual(line.text_without_whitespace, "ab")
+        self.assertEqual(line.start_time, at(1000))
+
+    def test_extend_characters_accepts_generator(self):
+        line = EnhancedLyricLine([char(1000, "a")])
+        line.extend_characters(char(ms, "b") for ms in (2000, 3000))
+        self.assertEqual(len(line), 3)
+        self.assertEqual(line.text, "abb")
+        self.assertEqual(str(line), "[00:01.000]a[00:02.000]b[00:03.000]b")
+        self.assertEqual(len(list(line)), 3)
+
+    def test_characters_setter_accepts_generator(self):
+        line = EnhancedLyricLine()
+        line.characters = (char(ms, c) for ms, c in ((1000, "x"), (2000, "y")))
+        self.assertEqual(len(line), 2)
+        self.assertEqual(line.text, "xy")
+        self.assertEqual(line.end_time, at(2000))
+
+    def test_characters_setter(self):
+        line = EnhancedLyricLine([char(1000, "a")])
+        line.characters = [char(5000, "x"), char(6000, "y")]
+        self.assertEqual(line.text, "xy")
+        self.assertEqual(line.start_time, at(5000))
+        self.assertEqual(list(line.characters), [char(5000, "x"), char(6000, "y")])
+
+    def test_characters_is_cached_and_read_only(self):
+        line = EnhancedLyricLine.from_string("[00:01.00]a[00:02.00]b")
+        self.assertIs(line.characters, line.characters)
+        self.assertIs(line[0], line.characters[0])
+        with self.assertRaises(AttributeError):
+            line.characters.append(char(3000, "c"))
+        line.add_character(char(3000, "c"))
+        self.assertEqual([c.character for c in line], ["a", "b", "c"])
+
+    def test_cached_characters_are_read_only(self):
+        line = EnhancedLyricLine.from_string("[00:01.00]a[00:02.00] [00:03.00]b")
+        with self.assertRaises(AttributeError):
+            line[0].character = "X"
+        with self.assertRaises(AttributeError):
+            line.split_by_whitespace()[0][0].time = at(5000)
+        with self.assertRaises(AttributeError):
+            line.get_character_at_time(at(3000)).character = "X"
+        self.assertEqual(line.text, "a b")
+        self.assertEqual(line[0].character, "a")
+        self.assertIsInstance(line[0], TimedCharacter)
+        self.assertEqual(line[0], char(1000, "a"))
+
+        # 通过赋值修改后，新构建的字符反映修改
+        edited = [TimedCharacter(c.time, c.character.upper()) for c in line]
+        line.characters = edited
+        self.assertEqual(line.text, "A B")
+        self.assertEqual(line[0].character, "A")
+
+    def test_sort_characters(self):
+        line = EnhancedLyricLine(
+            [char(2000, "b"), char(1000, "a"), char(2000, "c"), char(500, "z")]
+        )
+        self.assertEqual(line.text, "bacz")
+        line.sort_characters()
+        self.assertEqual(line.text, "zabc")
+        self.assertEqual(line.start_time, at(500))
+        self.assertEqual(line.end_time, at(2000))
+
+    def test_end_time_override(self):
+        line = EnhancedLyricLine.from_string("[00:01.00]a[00:02.00]b")
+        self.assertEqual(line.end_time, at(2000))
+        line.set_end_time_override(at(9000))
+        self.assertEqual(line.end_time, at(9000))
+        line.add_character(char(3000, "c"))
+        self.assertEqual(line.end_time, at(9000))
+        line.clear_end_time_override()
+        self.assertEqual(line.end_time, at(3000))
+
+    def test_get_character_at_time_monotonic(self):
+        line = EnhancedLyricLine.from_string(
+            "[00:01.00]a[00:02.00]b[00:02.00]c[00:03.00]d[00:05.00]e"
+        )
+        expected = {
+            0: None,
+            999: None,
+            1000: "a",
+            1500: "a",
+            2000: "c",
+            2999: "c",
+            3000: "d",
+            4000: "d",
+            5000: "e",
+            9000: "e",
+        }
+        for ms, character in expected.items():
+            found = line.get_character_at_time(at(ms))
+            if character is None:
+                self.assertIsNone(found, ms)
+            else:
+                self.assertEqual(found.character, character, ms)
+        # 非单调查询同样正确
+        self.assertEqual(line.get_character_at_time(at(1200)).character, "a")
+        self.assertIsNone(line.get_character_at_time(at(10)))
+
+    def test_get_characters_in_range(self):
+        line = EnhancedLyricLine.from_string("[00:01.00]a[00:02.00]b[00:03.00]c")
+        found = line.get_characters_in_range(at(1500), at(3000))
+        self.assertEqual([c.character for c in found], ["b", "c"])
+        self.assertEqual(line.get_characters_in_range(at(3000), at(1000)), [])
+
+    def test_split_by_whitespace(self):
+        line = EnhancedLyricLine.from_string(
+            "[00:01.00]a[00:02.00]b[00:03.00] [00:04.00]c[00:05.00]"
+        )
+        words = line.split_by_whitespace()
+        self.assertEqual([[c.character for c in w] for w in words], [["a", "b"], ["c"]])
+
+    def test_ordering(self):
+        empty = EnhancedLyricLine.empty_line()
+        early = EnhancedLyricLine.from_string("[00:01.00]a")
+        late = EnhancedLyricLine.from_string("[00:02.00]b")
+        self.assertEqual(sorted([empty, late, early]), [early, late, empty])
+        self.assertTrue(early < late)
+        self.assertTrue(late >= early)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from lyricsx.model import CombinedLyricLine
+from lyricsx.parser.lrc_parser import EnhancedLyricParser, StandardLRCParser
+
+
+class StandardLRCParserTest(unittest.TestCase):
+    def test_round_trip(self):
+        text = "[ar:Artist]\n[ti:Title]\n[00:12.34]Hello world\n[00:15.000]Test"
+        doc = StandardLRCParser.parse(text)
+        self.assertEqual(
+            doc.to_lrc(),
+            "[ar:Artist]\n[ti:Title]\n[00:12.340]Hello world\n[00:15.000]Test",
+        )
+
+    def test_tags(self):
+        doc = StandardLRCParser.parse("[ar:Artist Name]\n[offset:+100]\n[ti:]")
+        self.assertEqual(
+            [(m.tag, m.value) for m in doc.meta], [("ar", "Artist Name")]
+        )
+        self.assertEqual(doc.lines, [])
+
+    def test_strips_surrounding_whitespace(self):
+        doc = StandardLRCParser.parse("  [ar:A]\t\n   [00:01.5]  text  \n")
+        self.assertEqual(doc.to_lrc(), "[ar:A]\n[00:01.500]  text")
+
+    def test_crlf(self):
+        doc = StandardLRCParser.parse("[ar:A]\r\n[00:01.00]a\r\n[00:02.00]b\r\n")
+        self.assertEqual(doc.to_lrc(), "[ar:A]\n[00:01.000]a\n[00:02.000]b")
+
+    def test_bare_cr(self):
+        doc = StandardLRCParser.parse("[ar:A]\r[00:01.00]a\r[00:02.00]b")
+        self.assertEqual(doc.to_lrc(), "[ar:A]\n[00:01.000]a\n[00:02.000]b")
+
+    def test_unicode_line_separator(self):
+        doc = StandardLRCParser.parse("[00:01.00]a\u2028[00:02.00]b")
+        self.assertEqual(doc.to_lrc(), "[00:01.000]a\n[00:02.000]b")
+
+    def test_multiple_timestamps_keep_first(self):
+        doc = StandardLRCParser.parse("[00:01.00][00:05.00]chorus")
+        self.assertEqual(len(doc.lines), 1)
+        self.assertEqual(doc.lines[0].time.total_milliseconds, 1000)
+        self.assertEqual(doc.lines[0].texts, "[00:05.00]chorus")
+
+    def test_skips_unrecognised_lines(self):
+        doc = StandardLRCParser.parse("just text\n[xx]\n\n[00:01.00]a")
+        self.assertEqual(doc.to_lrc(), "[00:01.000]a")
+
+    def test_rejects_out_of_range_seconds(self):
+        with self.assertRaises(ValueError):
+            StandardLRCParser.parse("[00:75.00]a")
+
+    def test_parse_with_translate(self):
+        origin = "[ti:T]\n[00:02.00]two\n[00:01.00]one\n[00:03.00]three"
+        trans = "[00:01.00]一\n[00:02.05]二"
+        doc = StandardLRCParser.parse_with_translate(origin, 50, trans)
+        self.assertTrue(all(isinstance(x, CombinedLyricLine) for x in doc.lines))
+        self.assertEqual(
+            doc.to_lrc(),
+            "[ti:T]\n[00:01.000]one\n[00:01.000]一\n"
+            "[00:02.000]two\n[00:02.000]二\n[00:03.000]three",
+        )
+
+
+class EnhancedLyricParserTest(unittest.TestCase):
+    def test_round_trip(self):
+        text = "[ti:T]\r\n[00:01.00]a[00:01.5]b[00:02.000]\r\n[00:03.00]c"
+        doc = EnhancedLyricParser.parse(text)
+        self.assertEqual(
+            doc.to_lrc(),
+            "[ti:T]\n[00:01.000]a[00:01.500]b[00:02.000]\n[00:03.000]c",
+        )
+        self.assertEqual([line.text for line in doc.lines], ["ab", "c"])
+
+    def test_rejects_out_of_range_seconds(self):
+        with self.assertRaises(ValueError):
+            EnhancedLyricParser.parse("[00:59.99]a[00:60.00]b")
+
+
+if __name__ == "__main__":
+    unittest.main()
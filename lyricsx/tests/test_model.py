@@ -0,0 +1,36 @@
+import unittest
+
+from lyricsx.model import LRCTime
+
+
+class LRCTimeTest(unittest.TestCase):
+    def test_parse_and_format(self):
+        time = LRCTime("01", "02", "3")
+        self.assertEqual(str(time), "01:02.300")
+        self.assertEqual(time.total_milliseconds, 62300)
+        self.assertEqual((time.minutes, time.seconds, time.milliseconds), (1, 2, 300))
+
+    def test_from_total_milliseconds(self):
+        time = LRCTime.from_total_milliseconds(62300)
+        self.assertEqual(time, LRCTime("01", "02", "300"))
+        self.assertEqual(str(time), "01:02.300")
+
+    def test_from_total_milliseconds_rejects_invalid_input(self):
+        with self.assertRaises(TypeError):
+            LRCTime.from_total_milliseconds(1500.7)
+        with self.assertRaises(TypeError):
+            LRCTime.from_total_milliseconds("1500")
+        with self.assertRaises(ValueError):
+            LRCTime.from_total_milliseconds(-1)
+
+    def test_rejects_invalid_components(self):
+        with self.assertRaises(ValueError):
+            LRCTime("00", "60", "000")
+        with self.assertRaises(ValueError):
+            LRCTime("0a", "00", "000")
+        with self.assertRaises(TypeError):
+            LRCTime(0, "00", "000")
+
+
+if __name__ == "__main__":
+    unittest.main()